@@ -1 +1,79 @@
+"""Playing cards encoded as plain integers.
 
+A card is an int in ``range(52)`` laid out as ``rank_index * 4 + suit_index``.
+Gameplay only needs a card's blackjack value and whether it is an ace, so both
+are read from precomputed tables instead of per-card objects.
+"""
+
+import random
+
+SUIT_SYMBOLS = ("♥", "♦", "♣", "♠")
+RANK_SYMBOLS = ("2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A")
+RANK_VALUES = bytes([2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 11])
+ACE_RANK = 12
+
+DECK_SIZE = len(RANK_SYMBOLS) * len(SUIT_SYMBOLS)
+
+_STRS = tuple(rank + suit for rank in RANK_SYMBOLS for suit in SUIT_SYMBOLS)
+
+
+def card_value(card: int) -> int:
+    """Blackjack value of a card, counting an ace as 11."""
+    return RANK_VALUES[card // 4]
+
+
+def card_is_ace(card: int) -> bool:
+    return card // 4 == ACE_RANK
+
+
+def card_str(card: int) -> str:
+    """Display form of a card, e.g. ``"10♥"`` or ``"A♠"``."""
+    return _STRS[card]
+
+
+def hand_score(cards) -> int:
+    """Best blackjack total of a hand, demoting aces from 11 to 1 as needed.
+
+    Each demotion subtracts 10, so the number of aces to demote is computed
+    in one step rather than in a loop.
+    """
+    total = 0
+    aces = 0
+    for card in cards:
+        rank = card // 4
+        total += RANK_VALUES[rank]
+        aces += rank == ACE_RANK
+    if total <= 21:
+        return total
+    return total - 10 * min(aces, (total - 12) // 10)
+
+
+class Deck:
+    """A shuffled 52-card deck dealt through an index cursor.
+
+    The permutation is kept as a tuple and never mutated; dealing just
+    advances ``_idx``. The deck reshuffles itself once it runs out.
+
+    ``rng`` is any ``random.Random``-like object; passing a seeded instance
+    makes dealing reproducible and keeps it off the shared module generator.
+    """
+
+    def __init__(self, rng=None):
+        self._rng = rng or random
+        self.reset()
+
+    def reset(self):
+        self._cards = tuple(self._rng.sample(range(DECK_SIZE), DECK_SIZE))
+        self._idx = 0
+
+    shuffle = reset
+
+    def deal(self) -> int:
+        if self._idx == DECK_SIZE:
+            self.reset()
+        card = self._cards[self._idx]
+        self._idx += 1
+        return card
+
+    def __len__(self):
+        return DECK_SIZE - self._idx
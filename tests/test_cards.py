@@ -0,0 +1,59 @@
+import random
+
+import pytest
+from project.game.cards import (
+    DECK_SIZE,
+    Deck,
+    card_is_ace,
+    card_str,
+    card_value,
+    hand_score,
+)
+
+
+def test_deck_size():
+    assert DECK_SIZE == 52
+
+
+@pytest.mark.parametrize(
+    "card, value, text",
+    [(0, 2, "2♥"), (3, 2, "2♠"), (33, 10, "10♦"), (44, 10, "K♥"), (51, 11, "A♠")],
+)
+def test_card_encoding(card, value, text):
+    assert card_value(card) == value
+    assert card_str(card) == text
+
+
+def test_only_last_rank_is_ace():
+    assert [c for c in range(DECK_SIZE) if card_is_ace(c)] == [48, 49, 50, 51]
+
+
+def test_deck_deals_each_card_once_then_reshuffles():
+    deck = Deck()
+    dealt = [deck.deal() for _ in range(DECK_SIZE)]
+    assert sorted(dealt) == list(range(DECK_SIZE))
+    assert len(deck) == 0
+    deck.deal()
+    assert len(deck) == DECK_SIZE - 1
+
+
+def test_seeded_decks_deal_the_same_cards():
+    a = Deck(random.Random(7))
+    b = Deck(random.Random(7))
+    assert [a.deal() for _ in range(60)] == [b.deal() for _ in range(60)]
+
+
+# Aces are the top rank (48..51), tens-valued K/Q are 44 and 40, a nine is 28.
+@pytest.mark.parametrize(
+    "hand, score",
+    [
+        ([48, 49, 28], 21),
+        ([48, 49, 50, 28], 12),
+        ([48, 44, 40], 21),
+        ([48, 49], 12),
+        ([44, 40, 28], 29),
+        ([], 0),
+    ],
+)
+def test_hand_score(hand, score):
+    assert hand_score(hand) == score